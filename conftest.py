@@ -0,0 +1 @@
+# Lets pytest import evaluation_framework from the repository root
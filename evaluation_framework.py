@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+"""
+Python Student Competence Analysis: Evaluation Framework
+A demonstration of the proposed approach for evaluating open source models.
+"""
+
+import ast
+import functools
+import hashlib
+import io
+import os
+import re
+import sys
+import threading
+import tokenize
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Protocol, cast
+from dataclasses import dataclass
+
+# When the module is compiled with mypyc, classes users may subclass are
+# marked to allow interpreted subclasses; a no-op without mypy_extensions
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[Any], Any]:  # type: ignore[misc]
+        return lambda cls: cls
+
+# Prefer orjson for report serialization; both paths produce UTF-8 bytes
+_dumps: Callable[[Any], bytes]
+try:
+    import orjson  # type: ignore[import-not-found]
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        # Compact separators match orjson byte-for-byte on the reports
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    _dumps = _json_dumps
+
+# Optional C implementation of the AST traversal (built from
+# src/_fast_ast_stats.c by setup.py); falls back to the Python loop
+_count_nodes: Optional[Callable[[ast.AST], Tuple[int, int]]]
+try:
+    from _fast_ast_stats import count_nodes as _count_nodes  # type: ignore[import-not-found,no-redef]
+except ImportError:
+    _count_nodes = None
+
+# Cheap prefilter for _check_syntax_issues: an if/elif statement header
+# containing a bare "=" (not ==, !=, <=, >=, :=) somewhere on the line.
+# Anchored at the start of the line so each line is scanned at most once.
+_IF_ASSIGN_RE = re.compile(
+    r'^[ \t]*(?:el)?if\b[^\n]*?(?<![=!<>:])=(?!=)',
+    re.MULTILINE
+)
+
+@dataclass(frozen=True, slots=True)
+class CodeAnalysisResult:
+    """Results from analyzing student code"""
+    syntax_errors: Tuple[str, ...]
+    logical_issues: Tuple[str, ...]
+    misconceptions: Tuple[str, ...]
+    complexity_score: float
+    confidence: float
+    has_assignment_in_condition: bool
+    has_missing_return: bool
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__: the default frozen-dataclass state
+        # restore fails on mypyc-compiled builds
+        return (CodeAnalysisResult, (
+            self.syntax_errors, self.logical_issues, self.misconceptions,
+            self.complexity_score, self.confidence,
+            self.has_assignment_in_condition, self.has_missing_return))
+
+@dataclass(frozen=True, slots=True)
+class GeneratedPrompt:
+    """A generated competence assessment prompt"""
+    text: str
+    category: str  # "conceptual", "debugging", "extension"
+    difficulty_level: int  # 1-5
+    learning_objective: str
+    
+    def __post_init__(self) -> None:
+        # Categories come from a tiny fixed vocabulary; interning makes
+        # duplicates share one object and compare by identity
+        object.__setattr__(self, 'category', sys.intern(self.category))
+
+class CodeAnalyzer(Protocol):
+    """Structural interface for code analysis"""
+    
+    def analyze(self, code: str) -> CodeAnalysisResult:
+        ...
+
+_EMPTY_RESULT = CodeAnalysisResult(
+    syntax_errors=(),
+    logical_issues=(),
+    misconceptions=(),
+    complexity_score=0.0,
+    confidence=1.0,
+    has_assignment_in_condition=False,
+    has_missing_return=False
+)
+
+# Not a problem with the student's code, so reported as a logical issue with
+# zero confidence rather than as a syntax error
+_TOO_LARGE_RESULT = CodeAnalysisResult(
+    syntax_errors=(),
+    logical_issues=("Input too large to analyze",),
+    misconceptions=(),
+    complexity_score=0.0,
+    confidence=0.0,
+    has_assignment_in_condition=False,
+    has_missing_return=False
+)
+
+# Parse straight to an AST; on Python 3.13+ also constant-fold it first,
+# which leaves fewer nodes for the traversal to visit
+_PARSE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, 'PyCF_OPTIMIZED_AST', 0)
+
+# Sentinel pushed on the traversal stack to mark the end of a scope body
+_LEAVE_FUNCTION = ast.AST()
+
+# Nested scopes that own the Returns inside them but are not themselves
+# checked for a missing return
+_OTHER_SCOPE_TYPES = frozenset({ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef})
+
+# Node types that add one point of complexity
+_BRANCH_TYPES = frozenset({ast.For, ast.While, ast.If})
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class BasicPythonAnalyzer:
+    """Basic analyzer using AST and common patterns"""
+    
+    def __init__(self, max_chars: int = 1 << 20):
+        self.max_chars = max_chars
+    
+    def analyze(self, code: str, mode: str = "full") -> CodeAnalysisResult:
+        if mode not in ("full", "quick"):
+            raise ValueError(f"Unknown analysis mode: {mode!r}")
+        
+        # Trivial and oversized inputs are answered without parsing (and
+        # kept out of the cache)
+        if not code or code.isspace():
+            return _EMPTY_RESULT
+        if len(code) > self.max_chars:
+            return _TOO_LARGE_RESULT
+        
+        # Quick mode only reports token-level issues: no AST, no complexity
+        if mode == "quick":
+            scan = self._quick_token_scan(code)
+            return CodeAnalysisResult(
+                syntax_errors=tuple(scan["syntax_errors"]),
+                logical_issues=(),
+                misconceptions=(),
+                complexity_score=0.0,
+                confidence=0.5,
+                has_assignment_in_condition=scan["has_assignment_in_condition"],
+                has_missing_return=False
+            )
+        
+        # Small inputs are memoized per analyzer instance, so reusing one
+        # analyzer across evaluators shares its cache and instance
+        # configuration is honored. Large inputs are not cached, to bound
+        # the memory the cache can hold
+        if len(code) > _PARSE_CACHE_MAX_CHARS:
+            return self._analyze(code)
+        return _cached_analyze(self, code)
+    
+    def _analyze(self, code: str) -> CodeAnalysisResult:
+        """Uncached analysis of a single submission"""
+        syntax_errors: List[str] = []
+        logical_issues: List[str] = []
+        misconceptions: List[str] = []
+        complexity = 0.0
+        has_assignment_in_condition = False
+        has_missing_return = False
+        
+        try:
+            # Parse the code (small inputs go through the shared parse cache)
+            tree = _parse(code)
+            
+            # Basic analysis; each helper reports a single kind of issue,
+            # so a non-empty result is the flag the prompt rules branch on
+            complexity, misconceptions = self._analyze_tree(tree)
+            syntax_errors = self._check_syntax_issues(code)
+            has_assignment_in_condition = bool(syntax_errors)
+            has_missing_return = bool(misconceptions)
+            
+        except SyntaxError as e:
+            syntax_errors.append(f"Syntax error: {str(e)}")
+            
+        return CodeAnalysisResult(
+            syntax_errors=tuple(syntax_errors),
+            logical_issues=tuple(logical_issues),
+            misconceptions=tuple(misconceptions),
+            complexity_score=complexity,
+            confidence=0.8,
+            has_assignment_in_condition=has_assignment_in_condition,
+            has_missing_return=has_missing_return
+        )
+    
+    def _analyze_tree(self, tree: ast.AST) -> Tuple[float, List[str]]:
+        """Calculate complexity and detect misconceptions in a single pass"""
+        if _count_nodes is not None:
+            complexity, missing_returns = _count_nodes(tree)
+            return (min(complexity / 10.0, 1.0),
+                    ["Function may be missing return statement"] * missing_returns)
+        
+        complexity = 0
+        misconceptions: List[str] = []
+        function_names: List[Optional[str]] = []  # None: not checked
+        function_returns: List[bool] = []
+        
+        # Explicit stack instead of ast.walk avoids the generator overhead;
+        # a _LEAVE_FUNCTION marker is popped after a scope's body (post-order)
+        stack: List[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            
+            if node is _LEAVE_FUNCTION:
+                has_return = function_returns.pop()
+                name = function_names.pop()
+                if not has_return and name is not None and name != '__init__':
+                    misconceptions.append("Function may be missing return statement")
+                continue
+            
+            # Exact type checks: the parser never produces AST subclasses
+            node_type = type(node)
+            if node_type in _BRANCH_TYPES:
+                complexity += 1
+            elif node_type is ast.FunctionDef:
+                complexity += 2
+                function_names.append(cast(ast.FunctionDef, node).name)
+                function_returns.append(False)
+                stack.append(_LEAVE_FUNCTION)
+            elif node_type in _OTHER_SCOPE_TYPES:
+                function_names.append(None)
+                function_returns.append(False)
+                stack.append(_LEAVE_FUNCTION)
+            elif node_type is ast.Return:
+                if function_returns:
+                    function_returns[-1] = True
+            
+            # Inlined ast.iter_child_nodes
+            for name in node._fields:
+                child = getattr(node, name, None)
+                if isinstance(child, ast.AST):
+                    stack.append(child)
+                elif isinstance(child, list):
+                    for item in child:
+                        if isinstance(item, ast.AST):
+                            stack.append(item)
+        
+        return min(complexity / 10.0, 1.0), misconceptions
+    
+    def _quick_token_scan(self, code: str) -> Dict[str, Any]:
+        """Detect assignment in if/elif conditions from the token stream"""
+        issues: List[str] = []
+        has_assignment = False
+        in_condition = False
+        depth = 0
+        
+        try:
+            for tok in tokenize.generate_tokens(io.StringIO(code).readline):
+                if tok.type == tokenize.NEWLINE:
+                    in_condition = False
+                    depth = 0
+                elif tok.type == tokenize.NAME:
+                    # Only statement-level ifs, not conditional expressions
+                    if depth == 0 and tok.string in ('if', 'elif'):
+                        in_condition = True
+                elif tok.type == tokenize.OP:
+                    if tok.string in ('(', '[', '{'):
+                        depth += 1
+                    elif tok.string in (')', ']', '}'):
+                        depth -= 1
+                    elif not in_condition or depth:
+                        continue
+                    elif tok.string == '=':
+                        issues.append(f"Line {tok.start[0]}: Possible assignment in condition")
+                        has_assignment = True
+                        in_condition = False
+                    elif tok.string in (':', ';'):
+                        in_condition = False
+        except (tokenize.TokenError, SyntaxError) as e:
+            issues.append(f"Syntax error: {str(e)}")
+        
+        return {
+            "syntax_errors": issues,
+            "has_assignment_in_condition": has_assignment
+        }
+    
+    def _check_syntax_issues(self, code: str) -> List[str]:
+        """Check for common syntax issues"""
+        if 'if' not in code or _IF_ASSIGN_RE.search(code) is None:
+            return []
+        
+        # The regex cannot tell an "=" in the condition from one inside
+        # brackets, a string or the body after the header ":", so candidates
+        # are confirmed with the bracket-aware token scan
+        issues: List[str] = self._quick_token_scan(code)["syntax_errors"]
+        return issues
+
+# Holds at most 1024 sources of <= _PARSE_CACHE_MAX_CHARS each (a few MB);
+# analyzers are referenced only by their live entries
+@functools.lru_cache(maxsize=1024)
+def _cached_analyze(analyzer: "BasicPythonAnalyzer", code: str) -> CodeAnalysisResult:
+    return analyzer._analyze(code)
+
+# A tree costs roughly 30 bytes per source character, so only small inputs
+# are cached: at most 256 trees of <= 4096 chars (a few tens of MB). The
+# cache lets different analyzers share one parse; BasicPythonAnalyzer
+# results are already memoized by _cached_analyze. Cached trees are shared
+# between callers and must not be mutated.
+_PARSE_CACHE_MAX_CHARS = 4096
+
+def _parse(code: str) -> ast.AST:
+    if len(code) > _PARSE_CACHE_MAX_CHARS:
+        return _compile_tree(code)
+    return _parse_cached(code)
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(code: str) -> ast.AST:
+    return _compile_tree(code)
+
+def _compile_tree(code: str) -> ast.AST:
+    tree: ast.AST = compile(code, '<student>', 'exec', flags=_PARSE_FLAGS,
+                            dont_inherit=True, optimize=2)
+    return tree
+
+def clear_caches() -> None:
+    """Drop the module-level parse and analysis caches"""
+    _parse_cached.cache_clear()
+    _cached_analyze.cache_clear()
+
+class PromptGenerator(Protocol):
+    """Structural interface for prompt generation"""
+    
+    def generate_prompts(self, code: str, analysis: CodeAnalysisResult) -> Iterable[GeneratedPrompt]:
+        ...
+
+# Learning objectives shared by the static prompt rules
+_OBJ_SYNTAX = "Syntax error identification and resolution"
+_OBJ_ASSIGNMENT = "Understanding assignment vs equality operators"
+_OBJ_RETURN = "Function return values and program flow"
+_OBJ_ANALYSIS = "Algorithm analysis and explanation"
+
+# Static prompt rules: (flag name, prompt emitted when the flag is set).
+# GeneratedPrompt is frozen, so the same instances are shared across calls.
+_PROMPT_RULES: Tuple[Tuple[str, GeneratedPrompt], ...] = (
+    ("has_syntax_errors", GeneratedPrompt(
+        text="Look at your code structure. Can you identify any syntax issues? What might Python be expecting differently?",
+        category="debugging",
+        difficulty_level=2,
+        learning_objective=_OBJ_SYNTAX
+    )),
+    ("has_assignment_in_condition", GeneratedPrompt(
+        text="In your conditional statement, consider the difference between assignment (=) and comparison (==). Which operation do you intend to perform?",
+        category="conceptual",
+        difficulty_level=3,
+        learning_objective=_OBJ_ASSIGNMENT
+    )),
+    ("has_missing_return", GeneratedPrompt(
+        text="Think about what your function should give back to the caller. What value or result should it return?",
+        category="conceptual",
+        difficulty_level=3,
+        learning_objective=_OBJ_RETURN
+    )),
+    ("complex", GeneratedPrompt(
+        text="Your solution shows good complexity. Can you explain the logic flow? How would you trace through it step by step?",
+        category="extension",
+        difficulty_level=4,
+        learning_objective=_OBJ_ANALYSIS
+    )),
+)
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class RuleBasedPromptGenerator:
+    """Rule-based prompt generator for demonstration"""
+    
+    def generate_prompts(self, code: str, analysis: CodeAnalysisResult) -> Iterator[GeneratedPrompt]:
+        # Evaluate each rule predicate once, then yield matching prompts
+        flags = {
+            "has_syntax_errors": bool(analysis.syntax_errors),
+            "has_assignment_in_condition": analysis.has_assignment_in_condition,
+            "has_missing_return": analysis.has_missing_return,
+            "complex": analysis.complexity_score > 0.5
+        }
+        for name, prompt in _PROMPT_RULES:
+            if flags[name]:
+                yield prompt
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class CompetenceEvaluator:
+    """Main evaluation framework"""
+    
+    def __init__(self, analyzer: CodeAnalyzer, prompt_generator: PromptGenerator,
+                 cache_size: int = 4096):
+        self.analyzer = analyzer
+        self.prompt_generator = prompt_generator
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, CodeAnalysisResult]" = OrderedDict()  # LRU
+        self._cache_lock = threading.Lock()
+        # Batch pool, created on first use and reused until close()
+        self._executor: Optional[Executor] = None
+        self._executor_config: Optional[Tuple[int, bool]] = None
+        
+    def __enter__(self) -> "CompetenceEvaluator":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Shut down the batch worker pool, if one was started"""
+        with self._cache_lock:
+            executor, self._executor = self._executor, None
+            self._executor_config = None
+        if executor is not None:
+            executor.shutdown()
+    
+    def _cache_get(self, key: bytes) -> Optional[CodeAnalysisResult]:
+        with self._cache_lock:
+            analysis = self._cache.get(key)
+            if analysis is not None:
+                self._cache.move_to_end(key)
+            return analysis
+    
+    def _cache_put(self, key: bytes, analysis: CodeAnalysisResult) -> None:
+        with self._cache_lock:
+            self._cache[key] = analysis
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _analyze(self, code: str) -> CodeAnalysisResult:
+        """Analyze code, reusing results for previously seen submissions"""
+        key = _digest(code)
+        analysis = self._cache_get(key)
+        if analysis is None:
+            analysis = self.analyzer.analyze(code)
+            self._cache_put(key, analysis)
+        return analysis
+        
+    def evaluate_student_code(self, code: str) -> Dict[str, Any]:
+        """Complete evaluation of student code"""
+        
+        # Analyze the code (cached by content hash)
+        return self._build_report(code, self._analyze(code))
+    
+    def _build_report(self, code: str, analysis: CodeAnalysisResult) -> Dict[str, Any]:
+        """Build the evaluation report for an analyzed submission"""
+        
+        # Generate prompts, folding them into the prompt list and summary
+        # in a single pass (generators are consumed lazily)
+        categories = set()
+        total_difficulty = 0
+        prompt_dicts = []
+        for p in self.prompt_generator.generate_prompts(code, analysis):
+            categories.add(p.category)
+            total_difficulty += p.difficulty_level
+            prompt_dicts.append({
+                "text": p.text,
+                "category": p.category,
+                "difficulty": p.difficulty_level,
+                "objective": p.learning_objective
+            })
+        n = len(prompt_dicts)
+        
+        # Create evaluation report
+        return {
+            "code": code,
+            "analysis": {
+                "syntax_errors": list(analysis.syntax_errors),
+                "logical_issues": list(analysis.logical_issues),
+                "misconceptions": list(analysis.misconceptions),
+                "complexity_score": analysis.complexity_score,
+                "confidence": analysis.confidence
+            },
+            "generated_prompts": prompt_dicts,
+            "summary": {
+                "total_prompts": n,
+                "categories": list(categories),
+                "avg_difficulty": total_difficulty / n if n else 0
+            }
+        }
+    
+    def evaluate_batch(self, codes: List[str], workers: Optional[int] = None,
+                       use_threads: bool = False) -> List[Dict[str, Any]]:
+        """Evaluate many submissions in parallel, preserving input order
+        
+        Only submissions missing from this evaluator's cache are sent to the
+        worker pool; their analyses are cached and the reports are built here.
+        The pool is kept for later batches until close() is called.
+        """
+        workers = workers or os.cpu_count() or 1
+        keys = [_digest(code) for code in codes]
+        analyses: Dict[bytes, CodeAnalysisResult] = {}
+        misses: Dict[bytes, str] = {}  # deduplicated, in first-seen order
+        for key, code in zip(keys, codes):
+            if key in analyses or key in misses:
+                continue
+            analysis = self._cache_get(key)
+            if analysis is None:
+                misses[key] = code
+            else:
+                analyses[key] = analysis
+        
+        if misses:
+            executor = self._get_executor(workers, use_threads)
+            # Threads share this evaluator's analyzer; worker processes got
+            # their own copy from _init_batch_worker
+            analyze = self.analyzer.analyze if use_threads else _analyze_in_worker
+            chunksize = max(1, len(misses) // (4 * workers))
+            results = executor.map(analyze, misses.values(), chunksize=chunksize)
+            for key, analysis in zip(misses, results):
+                analyses[key] = analysis
+                self._cache_put(key, analysis)
+        
+        return [self._build_report(code, analyses[key]) for key, code in zip(keys, codes)]
+    
+    def _get_executor(self, workers: int, use_threads: bool) -> Executor:
+        """Return the batch pool, replacing it if the configuration changed"""
+        config = (workers, use_threads)
+        stale: Optional[Executor] = None
+        with self._cache_lock:
+            if self._executor is None or self._executor_config != config:
+                stale = self._executor
+                if use_threads:
+                    self._executor = ThreadPoolExecutor(max_workers=workers)
+                else:
+                    # The analyzer is shipped once per worker process, never
+                    # per task
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=workers, initializer=_init_batch_worker,
+                        initargs=(self.analyzer,))
+                self._executor_config = config
+            executor = self._executor
+        if stale is not None:
+            stale.shutdown()
+        return executor
+    
+    @staticmethod
+    def dump_report(report: Dict[str, Any], fp: BinaryIO) -> None:
+        """Write a single report as JSON to a binary file handle"""
+        fp.write(_dumps(report))
+    
+    @staticmethod
+    def dump_reports(reports: Iterable[Dict[str, Any]], fp: BinaryIO) -> None:
+        """Stream reports as NDJSON, one report per line"""
+        for report in reports:
+            fp.write(_dumps(report))
+            fp.write(b"\n")
+
+def _digest(code: str) -> bytes:
+    return hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+
+_worker_analyzer: Optional[CodeAnalyzer] = None
+
+def _init_batch_worker(analyzer: CodeAnalyzer) -> None:
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _analyze_in_worker(code: str) -> CodeAnalysisResult:
+    assert _worker_analyzer is not None
+    return _worker_analyzer.analyze(code)
+
+def demonstrate_evaluation():
+    """Demonstrate the evaluation framework"""
+    
+    # Sample student code with common issues
+    sample_codes = [
+        # Code with assignment in condition
+        """
+def check_number(x):
+    if x = 5:
+        return "equal"
+    else:
+        return "not equal"
+        """,
+        
+        # Code missing return statement
+        """
+def calculate_sum(numbers):
+    total = 0
+    for num in numbers:
+        total += num
+        """,
+        
+        # More complex but correct code
+        """
+def fibonacci(n):
+    if n <= 1:
+        return n
+    else:
+        return fibonacci(n-1) + fibonacci(n-2)
+        """
+    ]
+    
+    # Initialize evaluator
+    analyzer = BasicPythonAnalyzer()
+    prompt_gen = RuleBasedPromptGenerator()
+    evaluator = CompetenceEvaluator(analyzer, prompt_gen)
+    
+    print("Python Student Competence Analysis - Demonstration")
+    print("=" * 60)
+    
+    for i, code in enumerate(sample_codes, 1):
+        print(f"\nExample {i}:")
+        print("-" * 40)
+        print("Student Code:")
+        print(code.strip())
+        
+        try:
+            result = evaluator.evaluate_student_code(code.strip())
+            
+            print(f"\nAnalysis Results:")
+            print(f"  Syntax Errors: {len(result['analysis']['syntax_errors'])}")
+            print(f"  Misconceptions: {len(result['analysis']['misconceptions'])}")
+            print(f"  Complexity Score: {result['analysis']['complexity_score']:.2f}")
+            
+            print(f"\nGenerated Prompts ({result['summary']['total_prompts']}):")
+            for j, prompt in enumerate(result['generated_prompts'], 1):
+                print(f"  {j}. [{prompt['category'].title()}] {prompt['text']}")
+                print(f"     Difficulty: {prompt['difficulty']}/5")
+                print()
+                
+        except Exception as e:
+            print(f"Error analyzing code: {e}")
+    
+    print("\nThis demonstration shows how the framework can:")
+    print("• Analyze Python code for common issues")
+    print("• Detect potential misconceptions") 
+    print("• Generate targeted prompts for learning")
+    print("• Classify prompts by category and difficulty")
+    print("\nNext steps: Integration with CodeT5+ for advanced prompt generation")
+
+if __name__ == "__main__":
+    demonstrate_evaluation()
@@ -0,0 +1,285 @@
+/*
+ * _fast_ast_stats: C implementation of BasicPythonAnalyzer's AST traversal.
+ *
+ * count_nodes(tree) walks an ast tree with an explicit heap-allocated stack
+ * and returns (complexity, missing_return_funcs):
+ *   complexity           +1 per For/While/If, +2 per FunctionDef
+ *   missing_return_funcs FunctionDefs (other than __init__) whose own body,
+ *                        excluding nested scopes (functions, async
+ *                        functions, lambdas and classes), contains no Return
+ *
+ * Semantics match the pure-Python fallback in evaluation_framework.py.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *AST_type;
+static PyObject *For_type;
+static PyObject *While_type;
+static PyObject *If_type;
+static PyObject *FunctionDef_type;
+static PyObject *AsyncFunctionDef_type;
+static PyObject *Lambda_type;
+static PyObject *ClassDef_type;
+static PyObject *Return_type;
+
+static PyObject *str_fields;
+static PyObject *str_name;
+
+/* A stack entry is either a node to visit or a marker for leaving a function */
+typedef struct {
+    PyObject *node;     /* strong reference, NULL for a leave-function marker */
+} entry;
+
+typedef struct {
+    entry *items;
+    Py_ssize_t size;
+    Py_ssize_t capacity;
+} node_stack;
+
+typedef struct {
+    char *has_return;
+    char *skip_check;   /* never reported: __init__ or a non-FunctionDef scope */
+    Py_ssize_t size;
+    Py_ssize_t capacity;
+} function_stack;
+
+static int
+node_stack_push(node_stack *s, PyObject *node)
+{
+    if (s->size == s->capacity) {
+        Py_ssize_t capacity = s->capacity ? s->capacity * 2 : 64;
+        entry *items = PyMem_Realloc(s->items, capacity * sizeof(entry));
+        if (items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        s->items = items;
+        s->capacity = capacity;
+    }
+    Py_XINCREF(node);
+    s->items[s->size++].node = node;
+    return 0;
+}
+
+static void
+node_stack_free(node_stack *s)
+{
+    while (s->size) {
+        Py_XDECREF(s->items[--s->size].node);
+    }
+    PyMem_Free(s->items);
+}
+
+static int
+function_stack_push(function_stack *s, char skip_check)
+{
+    if (s->size == s->capacity) {
+        Py_ssize_t capacity = s->capacity ? s->capacity * 2 : 16;
+        char *has_return = PyMem_Realloc(s->has_return, capacity);
+        if (has_return == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        s->has_return = has_return;
+        char *skip_items = PyMem_Realloc(s->skip_check, capacity);
+        if (skip_items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        s->skip_check = skip_items;
+        s->capacity = capacity;
+    }
+    s->has_return[s->size] = 0;
+    s->skip_check[s->size] = skip_check;
+    s->size++;
+    return 0;
+}
+
+static void
+function_stack_free(function_stack *s)
+{
+    PyMem_Free(s->has_return);
+    PyMem_Free(s->skip_check);
+}
+
+/* Push every AST child of node (inlined ast.iter_child_nodes) */
+static int
+push_children(node_stack *stack, PyObject *node)
+{
+    PyObject *fields = PyObject_GetAttr(node, str_fields);
+    if (fields == NULL) {
+        return -1;
+    }
+    if (!PyTuple_Check(fields)) {
+        Py_DECREF(fields);
+        return 0;
+    }
+
+    Py_ssize_t n = PyTuple_GET_SIZE(fields);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *child = PyObject_GetAttr(node, PyTuple_GET_ITEM(fields, i));
+        if (child == NULL) {
+            /* Unset optional fields are skipped, like getattr(node, name, None) */
+            if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                PyErr_Clear();
+                continue;
+            }
+            Py_DECREF(fields);
+            return -1;
+        }
+
+        int rc = 0;
+        if (PyObject_TypeCheck(child, (PyTypeObject *)AST_type)) {
+            rc = node_stack_push(stack, child);
+        }
+        else if (PyList_Check(child)) {
+            for (Py_ssize_t j = 0; j < PyList_GET_SIZE(child); j++) {
+                PyObject *item = PyList_GET_ITEM(child, j);
+                if (PyObject_TypeCheck(item, (PyTypeObject *)AST_type)) {
+                    if ((rc = node_stack_push(stack, item)) < 0) {
+                        break;
+                    }
+                }
+            }
+        }
+        Py_DECREF(child);
+        if (rc < 0) {
+            Py_DECREF(fields);
+            return -1;
+        }
+    }
+
+    Py_DECREF(fields);
+    return 0;
+}
+
+static PyObject *
+count_nodes(PyObject *module, PyObject *tree)
+{
+    node_stack stack = {NULL, 0, 0};
+    function_stack functions = {NULL, NULL, 0, 0};
+    long complexity = 0;
+    long missing_return = 0;
+
+    if (!PyObject_TypeCheck(tree, (PyTypeObject *)AST_type)) {
+        PyErr_SetString(PyExc_TypeError, "count_nodes() expects an ast.AST");
+        return NULL;
+    }
+    if (node_stack_push(&stack, tree) < 0) {
+        goto error;
+    }
+
+    while (stack.size) {
+        PyObject *node = stack.items[--stack.size].node;
+
+        if (node == NULL) {
+            /* Leaving a scope body (post-order) */
+            functions.size--;
+            if (!functions.has_return[functions.size] &&
+                !functions.skip_check[functions.size]) {
+                missing_return++;
+            }
+            continue;
+        }
+
+        /* Exact type checks: the parser never produces AST subclasses */
+        PyObject *node_type = (PyObject *)Py_TYPE(node);
+        if (node_type == For_type || node_type == While_type ||
+            node_type == If_type) {
+            complexity += 1;
+        }
+        else if (node_type == FunctionDef_type) {
+            complexity += 2;
+            PyObject *name = PyObject_GetAttr(node, str_name);
+            if (name == NULL) {
+                Py_DECREF(node);
+                goto error;
+            }
+            char skip_check = PyUnicode_Check(name) &&
+                           PyUnicode_CompareWithASCIIString(name, "__init__") == 0;
+            Py_DECREF(name);
+            if (function_stack_push(&functions, skip_check) < 0 ||
+                node_stack_push(&stack, NULL) < 0) {
+                Py_DECREF(node);
+                goto error;
+            }
+        }
+        else if (node_type == AsyncFunctionDef_type || node_type == Lambda_type ||
+                 node_type == ClassDef_type) {
+            /* Nested scope: owns its Returns but is never reported itself */
+            if (function_stack_push(&functions, 1) < 0 ||
+                node_stack_push(&stack, NULL) < 0) {
+                Py_DECREF(node);
+                goto error;
+            }
+        }
+        else if (node_type == Return_type) {
+            if (functions.size) {
+                functions.has_return[functions.size - 1] = 1;
+            }
+        }
+
+        int rc = push_children(&stack, node);
+        Py_DECREF(node);
+        if (rc < 0) {
+            goto error;
+        }
+    }
+
+    node_stack_free(&stack);
+    function_stack_free(&functions);
+    return Py_BuildValue("(ll)", complexity, missing_return);
+
+error:
+    node_stack_free(&stack);
+    function_stack_free(&functions);
+    return NULL;
+}
+
+static PyMethodDef fast_ast_stats_methods[] = {
+    {"count_nodes", count_nodes, METH_O,
+     "count_nodes(tree) -> (complexity, missing_return_funcs)"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef fast_ast_stats_module = {
+    PyModuleDef_HEAD_INIT,
+    "_fast_ast_stats",
+    "C implementation of the BasicPythonAnalyzer AST traversal",
+    -1,
+    fast_ast_stats_methods
+};
+
+PyMODINIT_FUNC
+PyInit__fast_ast_stats(void)
+{
+    PyObject *ast_module = PyImport_ImportModule("ast");
+    if (ast_module == NULL) {
+        return NULL;
+    }
+    AST_type = PyObject_GetAttrString(ast_module, "AST");
+    For_type = PyObject_GetAttrString(ast_module, "For");
+    While_type = PyObject_GetAttrString(ast_module, "While");
+    If_type = PyObject_GetAttrString(ast_module, "If");
+    FunctionDef_type = PyObject_GetAttrString(ast_module, "FunctionDef");
+    AsyncFunctionDef_type = PyObject_GetAttrString(ast_module, "AsyncFunctionDef");
+    Lambda_type = PyObject_GetAttrString(ast_module, "Lambda");
+    ClassDef_type = PyObject_GetAttrString(ast_module, "ClassDef");
+    Return_type = PyObject_GetAttrString(ast_module, "Return");
+    Py_DECREF(ast_module);
+    if (!AST_type || !For_type || !While_type || !If_type ||
+        !FunctionDef_type || !AsyncFunctionDef_type || !Lambda_type ||
+        !ClassDef_type || !Return_type) {
+        return NULL;
+    }
+
+    str_fields = PyUnicode_InternFromString("_fields");
+    str_name = PyUnicode_InternFromString("name");
+    if (str_fields == NULL || str_name == NULL) {
+        return NULL;
+    }
+
+    return PyModule_Create(&fast_ast_stats_module);
+}
@@ -0,0 +1,173 @@
+import ast
+import dataclasses
+import inspect
+import time
+from pathlib import Path
+
+import pytest
+
+import evaluation_framework
+from evaluation_framework import BasicPythonAnalyzer
+
+
+def test_assignment_in_condition_detected():
+    code = "x = 1\nif x = 5:\n    pass\nelif x = 6:\n    pass\nif x == 1 or x <= 2:\n    pass"
+    issues = BasicPythonAnalyzer()._check_syntax_issues(code)
+    assert issues == [
+        "Line 2: Possible assignment in condition",
+        "Line 4: Possible assignment in condition",
+    ]
+
+
+@pytest.mark.parametrize("code", [
+    "if s == 'a=b':\n    pass",
+    "if f(k=1) == 2:\n    pass",
+    "if x: y = 3",
+    "if x:\n    y = 3",
+    "if (n := 3) > 1 and x >= 2:\n    pass",
+])
+def test_assignment_in_condition_ignores_valid_code(code):
+    assert BasicPythonAnalyzer()._check_syntax_issues(code) == []
+
+
+def test_assignment_in_condition_long_line_is_linear():
+    # A long single line mentioning "if" used to backtrack quadratically
+    code = 'x = "' + "if a == b " * 32_000 + '"'
+    start = time.perf_counter()
+    assert BasicPythonAnalyzer()._check_syntax_issues(code) == []
+    assert time.perf_counter() - start < 1.0
+
+
+def test_analyze_cache_respects_subclass_configuration():
+    class ConfiguredAnalyzer(BasicPythonAnalyzer):
+        def __init__(self, confidence):
+            super().__init__()
+            self.confidence = confidence
+
+        def _analyze(self, code):
+            result = super()._analyze(code)
+            return dataclasses.replace(result, confidence=self.confidence)
+
+    assert ConfiguredAnalyzer(0.1).analyze("x = 1").confidence == 0.1
+    assert ConfiguredAnalyzer(0.9).analyze("x = 1").confidence == 0.9
+
+
+def test_analyze_cache_skips_large_inputs():
+    evaluation_framework.clear_caches()
+    analyzer = BasicPythonAnalyzer()
+    large = "x = 1\n" * (evaluation_framework._PARSE_CACHE_MAX_CHARS // 6 + 1)
+
+    analyzer.analyze(large)
+    assert evaluation_framework._cached_analyze.cache_info().currsize == 0
+
+    analyzer.analyze("x = 1")
+    assert evaluation_framework._cached_analyze.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("code", ["", "   \n", "x = 1"])
+def test_analyze_rejects_unknown_mode(code):
+    with pytest.raises(ValueError):
+        BasicPythonAnalyzer().analyze(code, mode="bogus")
+
+
+@pytest.mark.parametrize("code, errors", [
+    ("if x = 5:\n    pass", ["Line 1: Possible assignment in condition"]),
+    ("if x:\n    pass\nelif y = 3\n", ["Line 3: Possible assignment in condition"]),
+    ("if f(a, k=1):\n    pass", []),
+    ("y = a if b else c", []),
+    ("if x: y = 1", []),
+    ('if f"{a=}":\n    pass', []),
+])
+def test_quick_token_scan(code, errors):
+    scan = BasicPythonAnalyzer()._quick_token_scan(code)
+    assert scan["syntax_errors"] == errors
+    assert scan["has_assignment_in_condition"] == bool(errors)
+
+
+def test_quick_token_scan_reports_tokenizer_errors():
+    scan = BasicPythonAnalyzer()._quick_token_scan("x = (1,\n")
+    assert len(scan["syntax_errors"]) == 1
+    assert scan["syntax_errors"][0].startswith("Syntax error:")
+    assert not scan["has_assignment_in_condition"]
+
+
+def test_quick_mode_never_parses(monkeypatch):
+    def fail(code):
+        raise AssertionError("quick mode must not parse")
+    monkeypatch.setattr(evaluation_framework, "_parse", fail)
+    monkeypatch.setattr(evaluation_framework, "_compile_tree", fail)
+
+    # Full mode would flag the missing return and score the function
+    result = BasicPythonAnalyzer().analyze("def f():\n    pass", mode="quick")
+    assert result.complexity_score == 0.0
+    assert result.confidence == 0.5
+    assert result.misconceptions == ()
+    assert not result.has_missing_return
+
+
+# Read from disk: the imported module may be a mypyc build without source
+FRAMEWORK_SOURCE = Path(__file__).resolve().parent.parent / "evaluation_framework.py"
+
+@pytest.mark.parametrize("code, missing", [
+    ("def f():\n    def g():\n        return 1", 1),
+    ("def f():\n    async def g():\n        return 1", 1),
+    ("def f():\n    class C:\n        def m(self):\n            return 1", 1),
+    ("def f():\n    async def g():\n        pass\n    return g", 0),
+])
+def test_missing_return_ignores_nested_scopes(code, missing):
+    result = BasicPythonAnalyzer().analyze(code)
+    assert len(result.misconceptions) == missing
+
+
+BATCH_SOURCES = [
+    "def f():\n    pass",
+    "if x = 1:\n    pass",
+    "x = 1",
+    "def f():\n    pass",
+    "for i in range(3):\n    print(i)",
+]
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_evaluate_batch_matches_sequential(use_threads):
+    def make_evaluator():
+        return evaluation_framework.CompetenceEvaluator(
+            BasicPythonAnalyzer(), evaluation_framework.RuleBasedPromptGenerator())
+
+    expected = [make_evaluator().evaluate_student_code(code) for code in BATCH_SOURCES]
+    with make_evaluator() as evaluator:
+        assert evaluator.evaluate_batch(BATCH_SOURCES, workers=2, use_threads=use_threads) == expected
+        executor = evaluator._executor
+        # A second batch is served from the cache and reuses the same pool
+        assert evaluator.evaluate_batch(BATCH_SOURCES[::-1], workers=2, use_threads=use_threads) == expected[::-1]
+        assert evaluator._executor is executor
+    assert evaluator._executor is None
+
+
+PARITY_SOURCES = [
+    "def f():\n    pass",
+    "def f():\n    def g():\n        return 1",
+    "def f():\n    def g():\n        pass\n    return g",
+    "def __init__(self):\n    def h():\n        return 1",
+    "class A:\n    def __init__(self):\n        pass\n    def m(self):\n        for x in y:\n            if x:\n                return x",
+    "async def a():\n    while True:\n        pass",
+    "def f():\n    async def g():\n        return 1",
+    "def f():\n    class C:\n        def m(self):\n            return 1",
+    "x = [i for i in range(3) if i]\nlambda: 1",
+]
+
+
+@pytest.mark.parametrize(
+    "source", PARITY_SOURCES + [inspect.getsource(ast), FRAMEWORK_SOURCE.read_text(encoding="utf-8")]
+)
+def test_fast_ast_stats_matches_python_traversal(source, monkeypatch):
+    fast_ast_stats = pytest.importorskip("_fast_ast_stats")
+    tree = ast.parse(source)
+    analyzer = BasicPythonAnalyzer()
+
+    monkeypatch.setattr(evaluation_framework, "_count_nodes", fast_ast_stats.count_nodes)
+    fast = analyzer._analyze_tree(tree)
+    monkeypatch.setattr(evaluation_framework, "_count_nodes", None)
+    slow = analyzer._analyze_tree(tree)
+
+    assert fast == slow